@@ -1,13 +1,35 @@
 import os
-import requests
+import asyncio
+import aiohttp
+import numpy as np
 import pandas as pd
 import time
+import random
+import itertools
 import logging
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-import json
+import sqlite3
+import csv
 import sys
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional
 from dotenv import load_dotenv
+from aiolimiter import AsyncLimiter
+
+# orjson parses GitHub's responses several times faster, but the standard library will do
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    import json
+    json_loads = json.loads
+    
+    def json_dumps(obj):
+        """Serialize obj to compact UTF-8 JSON bytes, like orjson.dumps"""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode()
 
 # Set up logging
 logging.basicConfig(
@@ -21,78 +43,233 @@ logging.basicConfig(
 
 logger = logging.getLogger('github_analyzer')
 
+# Fields selected for each PR and issue search result
+PR_FRAGMENT = "... on PullRequest { state merged repository { name } }"
+ISSUE_FRAGMENT = "... on Issue { state repository { name } }"
+
+class LRUCache(OrderedDict):
+    """Dictionary that evicts its least recently used entry once it holds more than max_size items"""
+    def __init__(self, max_size=2048):
+        super().__init__()
+        self.max_size = max_size
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.max_size:
+            self.popitem(last=False)
+
+class ETagCache:
+    """SQLite store of API responses and their ETags, keyed by URL and kept across runs"""
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL, link TEXT NOT NULL)"
+        )
+    
+    def get(self, url):
+        """Return the stored (etag, body, link) of a URL, or None if it was never cached"""
+        return self.conn.execute("SELECT etag, body, link FROM responses WHERE url = ?", (url,)).fetchone()
+    
+    def set(self, url, etag, body, link):
+        """Store the raw body and Link header of a response under its ETag"""
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)", (url, etag, body, link))
+    
+    def close(self):
+        self.conn.close()
+
 class GitHubContributionAnalyzer:
-    def __init__(self, token, organizations, time_period_months=None):
+    def __init__(self, token, organizations, time_period_months=None, concurrency=5, skip_inactive=False):
         """
         Initialize the analyzer with GitHub token and organizations.
         
         Args:
-            token (str): GitHub personal access token
+            token (str or list): GitHub personal access token, or several tokens to rotate between
             organizations (list): List of GitHub organization names
             time_period_months (int, optional): Number of months to look back for contributions
+            concurrency (int): Number of user batches analyzed at the same time
+            skip_inactive (bool): Record users without any contributions in the time period as
+                zeros instead of analyzing them. Only applies to periods shorter than a year
         """
-        self.headers = {'Authorization': f'token {token}'}
+        self.tokens = token if isinstance(token, list) else [token]
+        self.headers = {'Accept': 'application/vnd.github+json'}
         self.organizations = organizations if isinstance(organizations, list) else [organizations]
         self.base_url = "https://api.github.com"
-        self.rate_limit_remaining = 5000  # Default GitHub API rate limit
-        self.rate_limit_reset = 0
+        
+        # Requests are spread round-robin over the tokens. Each one keeps its own
+        # [remaining, reset] state for every rate limit resource (core, search, graphql)
+        self._token_cycle = itertools.cycle(self.tokens)
+        self._token_limits = {t: {} for t in self.tokens}
+        
+        # Point cost of the latest GraphQL query, as reported in-band by GitHub
+        self._graphql_cost = 1
+        
+        # Shared HTTP session, opened when the analyzer is entered as an async context manager
+        self.session = None
+        
+        # Client-side token buckets: hourly primary budget, short-window secondary
+        # limit, and the stricter per-minute budget of the search API. The hourly and
+        # search budgets are per token, so they grow with the number of tokens
+        self._primary_limiter = AsyncLimiter(4800 * len(self.tokens), 3600)
+        self._secondary_limiter = AsyncLimiter(80, 60)
+        self._search_limiter = AsyncLimiter(30 * len(self.tokens), 60)
         
         logger.info(f"Initializing analyzer for organizations: {', '.join(self.organizations)}")
-        self.update_rate_limit_info()
+        
+        # Metric names, and the prefixed column names each organization's metrics are flattened into
+        self._metric_keys = ('pr_total', 'pr_merged', 'pr_open', 'commits', 'issues_opened', 'issues_closed',
+                             'issues_commented', 'repos_contributed', 'reviews_submitted')
+        self._org_columns = []
+        for org in self.organizations:
+            prefix = f"{org.replace('-', '_')}_"
+            self._org_columns.append((org, prefix, [f"{prefix}{key}" for key in self._metric_keys]))
         
         # Set time period filter if specified
         self.time_filter = ""
-        if time_period_months:
+        self._since = None
+        if time_period_months is not None:
             since_date = (datetime.now() - relativedelta(months=time_period_months)).strftime('%Y-%m-%d')
             self.time_filter = f"+created:>={since_date}"
+            self._since = f"{since_date}T00:00:00Z"
             logger.info(f"Setting time filter to {time_period_months} months (since {since_date})")
+        
+        # GitHub's contribution calendar spans at most a year, so the activity probe
+        # can only vouch for inactivity in shorter time periods
+        self.skip_inactive = skip_inactive and time_period_months is not None and time_period_months < 12
+        if skip_inactive and not self.skip_inactive:
+            logger.warning("Skipping inactive users needs a time period shorter than 12 months; analyzing everyone")
             
-        # Cache for API responses to avoid duplicate requests
-        self.cache = {}
+        # Cache for API responses to avoid duplicate requests, bounded to keep memory flat on long runs
+        self.cache = LRUCache(max_size=2048)
+        
+        # Persistent ETag cache, reused across runs for conditional requests
+        self.etag_cache_file = os.path.join(".cache", "contributions.sqlite")
+        self.etag_cache = None
+        
+        # GraphQL node IDs of analyzed users, resolved once per user
+        self._user_ids = {}
         
-        # For saving progress
+        # Users whose searches are aliased into one GraphQL query, sized to about 200 searches
+        # (four per user and organization). Batches that still exceed the node limit or time
+        # out on GitHub's side are split in half
+        self.user_batch_size = max(1, 50 // len(self.organizations))
+        self.concurrency = max(concurrency, 1)
+        
+        # For saving progress: one JSON line of statistics per completed user
         self.completed_users = set()
-        self.progress_file = "github_analysis_progress.json"
+        self._cached_results = []
+        self.progress_file = "github_analysis_progress.jsonl"
+        self._progress_fp = None  # Opened for appending on the first completed user
         self.load_progress()
         
         # Current date/time for reporting
         self.analysis_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(f"Analysis started at: {self.analysis_date}")
 
-    def update_rate_limit_info(self):
-        """Update information about the current rate limit status"""
-        try:
-            response = requests.get(f"{self.base_url}/rate_limit", headers=self.headers)
-            if response.status_code == 200:
-                data = response.json()
-                self.rate_limit_remaining = data['resources']['core']['remaining']
-                self.rate_limit_reset = data['resources']['core']['reset']
-                logger.info(f"API Rate Limit: {self.rate_limit_remaining} requests remaining, resets at {datetime.fromtimestamp(self.rate_limit_reset).strftime('%Y-%m-%d %H:%M:%S')}")
-            else:
-                logger.warning(f"Couldn't fetch rate limit info. Status code: {response.status_code}")
-        except Exception as e:
-            logger.error(f"Error checking rate limits: {str(e)}")
+    async def __aenter__(self):
+        """Open the HTTP session shared by all API requests"""
+        # A single keep-alive pool, so every request after the first reuses an open TLS connection
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=32, keepalive_timeout=60)
+        self.session = aiohttp.ClientSession(
+            headers=self.headers, connector=connector, timeout=aiohttp.ClientTimeout(total=30),
+            json_serialize=lambda obj: json_dumps(obj).decode()
+        )
+        self.etag_cache = ETagCache(self.etag_cache_file)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared HTTP session and the ETag cache"""
+        await self.session.close()
+        self.session = None
+        self.etag_cache.close()
+        self.etag_cache = None
+        if self._progress_fp is not None:
+            self._progress_fp.close()
+            self._progress_fp = None
+
+    @property
+    def rate_limit_remaining(self):
+        """GraphQL points remaining across all tokens, the budget the analysis mostly draws from"""
+        return sum(limits.get('graphql', [5000, 0])[0] for limits in self._token_limits.values())
+    
+    @property
+    def rate_limit_reset(self):
+        """Earliest time at which one of the tokens' GraphQL rate limits resets"""
+        return min(limits.get('graphql', [5000, 0])[1] for limits in self._token_limits.values())
 
-    def wait_for_rate_limit(self):
-        """Wait if we're close to hitting the rate limit"""
-        if self.rate_limit_remaining < 10:
+    async def update_rate_limit_info(self):
+        """Update information about the current rate limit status of every token"""
+        for i, token in enumerate(self.tokens):
+            label = f" (token {i+1}/{len(self.tokens)})" if len(self.tokens) > 1 else ""
+            try:
+                async with self.session.get(f"{self.base_url}/rate_limit", headers={'Authorization': f'token {token}'}) as response:
+                    if response.status == 200:
+                        resources = json_loads(await response.read())['resources']
+                        for resource in ('core', 'search', 'graphql'):
+                            if resource in resources:
+                                self._token_limits[token][resource] = [resources[resource]['remaining'], resources[resource]['reset']]
+                        for resource, name in (('graphql', "GraphQL points"), ('core', "REST requests")):
+                            if resource in resources:
+                                remaining, reset = self._token_limits[token][resource]
+                                logger.info(f"API Rate Limit{label}: {remaining} {name} remaining, resets at {datetime.fromtimestamp(reset).strftime('%Y-%m-%d %H:%M:%S')}")
+                    else:
+                        logger.warning(f"Couldn't fetch rate limit info{label}. Status code: {response.status}")
+            except Exception as e:
+                logger.error(f"Error checking rate limits{label}: {str(e)}")
+
+    async def wait_for_rate_limit(self, resource='core'):
+        """
+        Pick the next token that isn't close to a rate limit, waiting if every token is.
+        
+        Args:
+            resource (str): Rate limit the request counts against: core, search or graphql
+            
+        Returns:
+            str: Token to authenticate the next request with
+        """
+        # A GraphQL query can cost several points, so keep room for two more like the last one
+        threshold = {'graphql': max(10, 2 * self._graphql_cost), 'search': 1}.get(resource, 10)
+        while True:
             current_time = time.time()
-            if current_time < self.rate_limit_reset:
-                wait_time = self.rate_limit_reset - current_time + 5  # Add 5 seconds buffer
-                logger.info(f"Rate limit almost reached. Waiting for {wait_time:.1f} seconds until reset...")
-                time.sleep(wait_time)
-                self.update_rate_limit_info()
-                logger.info("Resuming API calls...")
-    
-    def save_progress(self):
-        """Save the current progress to a file"""
-        progress_data = {
-            'completed_users': list(self.completed_users),
-            'last_updated': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
+            resets = []
+            for _ in range(len(self.tokens)):
+                token = next(self._token_cycle)
+                remaining, reset = self._token_limits[token].get(resource, [threshold, 0])
+                if remaining >= threshold or current_time >= reset:
+                    return token
+                resets.append(reset)
+            
+            wait_time = min(resets) - current_time + 5  # Add 5 seconds buffer
+            logger.info(f"Rate limit almost reached. Waiting for {wait_time:.1f} seconds until reset...")
+            await asyncio.sleep(wait_time)
+            await self.update_rate_limit_info()
+            logger.info("Resuming API calls...")
+    
+    def save_progress(self, user_stats=None):
+        """
+        Save the current progress to a file.
+        
+        Each completed user is appended as soon as it finishes and synced to disk,
+        so calling this without statistics only has to flush what's buffered.
+        
+        Args:
+            user_stats (dict, optional): Statistics of a user that just completed
+        """
         try:
-            with open(self.progress_file, 'w') as f:
-                json.dump(progress_data, f)
+            if user_stats is not None:
+                if self._progress_fp is None:
+                    self._progress_fp = open(self.progress_file, 'ab')
+                self._progress_fp.write(json_dumps(user_stats) + b"\n")
+            if self._progress_fp is not None:
+                self._progress_fp.flush()
+                os.fsync(self._progress_fp.fileno())
             logger.debug(f"Progress saved: {len(self.completed_users)} users completed")
         except Exception as e:
             logger.error(f"Failed to save progress: {str(e)}")
@@ -101,289 +278,614 @@ class GitHubContributionAnalyzer:
         """Load progress from file if it exists"""
         try:
             if os.path.exists(self.progress_file):
-                with open(self.progress_file, 'r') as f:
-                    progress_data = json.load(f)
-                    self.completed_users = set(progress_data.get('completed_users', []))
-                    last_updated = progress_data.get('last_updated', 'unknown')
-                    if self.completed_users:
-                        logger.info(f"Loaded progress: {len(self.completed_users)} users already analyzed (last updated: {last_updated})")
+                with open(self.progress_file, 'rb+') as f:
+                    offset = valid_end = 0
+                    for line in f:
+                        offset += len(line)
+                        try:
+                            user_stats = json_loads(line)
+                        except ValueError:
+                            logger.warning(f"Skipping malformed line in {self.progress_file}")
+                            continue
+                        valid_end = offset
+                        self._cached_results.append(user_stats)
+                        self.completed_users.add(user_stats['username'].lower())
+                    
+                    # Drop a truncated last line left by an interrupted write so new lines append cleanly
+                    if valid_end < offset:
+                        f.truncate(valid_end)
+                    elif valid_end and not line.endswith(b"\n"):
+                        # The last record is complete but lost its newline; restore it so the
+                        # next append doesn't run onto the same line
+                        f.seek(valid_end)
+                        f.write(b"\n")
+                if self.completed_users:
+                    logger.info(f"Loaded progress: {len(self.completed_users)} users already analyzed")
         except Exception as e:
             logger.warning(f"Couldn't load progress file: {str(e)}")
     
-    def get_user_stats(self, username):
+    async def get_user_stats(self, username, contributions=None):
         """
         Get comprehensive statistics for a specific user across multiple organizations.
         
         Args:
             username (str): GitHub username
+            contributions (tuple, optional): The user's entry from _get_users_contributions,
+                when it was already fetched as part of a batch
             
         Returns:
             dict: Dictionary containing user statistics
         """
-        stats = {
-            'username': username,
-            'pr_total': 0,
-            'pr_merged': 0,
-            'pr_open': 0,
-            'commits': 0,
-            'issues_opened': 0,
-            'issues_closed': 0,
-            'issues_commented': 0,
-            'repos_contributed': set(),
-            'reviews_submitted': 0,
-            'organizations': {}
-        }
+        stats = {'username': username, **dict.fromkeys(self._metric_keys, 0)}
         
         # Track metrics separately for each organization
-        for org in self.organizations:
-            stats['organizations'][org] = {
-                'pr_total': 0,
-                'pr_merged': 0,
-                'pr_open': 0,
-                'commits': 0,
-                'issues_opened': 0,
-                'issues_closed': 0,
-                'issues_commented': 0,
-                'repos_contributed': set(),
-                'reviews_submitted': 0
-            }
+        org_stats_list = []
+        for _ in self.organizations:
+            org_stats = dict.fromkeys(self._metric_keys, 0)
+            org_stats['repos_contributed'] = set()
+            org_stats_list.append(org_stats)
         
         try:
-            for org in self.organizations:
-                logger.info(f"Analyzing {username}'s contributions to {org}...")
-                org_stats = stats['organizations'][org]
-                
-                # Fetch PRs created by user
-                prs_created_url = f"{self.base_url}/search/issues?q=author:{username}+org:{org}+is:pr{self.time_filter}&per_page=100"
-                pr_data = self._paginated_request(prs_created_url)
-                
-                if pr_data and 'items' in pr_data:
-                    pr_items = pr_data['items']
-                    org_stats['pr_total'] = len(pr_items)
-                    stats['pr_total'] += org_stats['pr_total']
-                    
-                    # Process each PR to get more details
-                    for pr in pr_items:
-                        if pr.get('state') == 'open':
-                            org_stats['pr_open'] += 1
-                            stats['pr_open'] += 1
-                        elif pr.get('state') == 'closed':
-                            # Check if PR was merged using pull_request.merged_at field
-                            if pr.get('pull_request', {}).get('merged_at'):
-                                org_stats['pr_merged'] += 1
-                                stats['pr_merged'] += 1
-                            
-                        # Extract repository name from PR URL
-                        repo_url = pr.get('repository_url', '')
-                        if repo_url:
-                            repo_name = repo_url.split('/')[-1]
-                            org_stats['repos_contributed'].add(repo_name)
-                            stats['repos_contributed'].add(f"{org}/{repo_name}")
-                
-                # Fetch issues created by user
-                issues_url = f"{self.base_url}/search/issues?q=author:{username}+org:{org}+is:issue{self.time_filter}&per_page=100"
-                issues_data = self._paginated_request(issues_url)
-                
-                if issues_data and 'items' in issues_data:
-                    issue_items = issues_data['items']
-                    org_stats['issues_opened'] = len(issue_items)
-                    stats['issues_opened'] += org_stats['issues_opened']
-                    
-                    # Count closed issues
-                    for issue in issue_items:
-                        if issue.get('state') == 'closed':
-                            org_stats['issues_closed'] += 1
-                            stats['issues_closed'] += 1
-                            
-                        # Extract repository info
-                        repo_url = issue.get('repository_url', '')
-                        if repo_url:
-                            repo_name = repo_url.split('/')[-1]
-                            org_stats['repos_contributed'].add(repo_name)
-                            stats['repos_contributed'].add(f"{org}/{repo_name}")
-                
-                # Get commit count
-                # Note: This is approximate as GitHub API doesn't provide a direct way to count all commits across an org
-                repo_batch_size = 3  # Limit batch size to manage rate limits
-                repo_list = list(org_stats['repos_contributed'])
-                
-                for i in range(0, len(repo_list), repo_batch_size):
-                    batch_repos = repo_list[i:i+repo_batch_size]
-                    for repo_name in batch_repos:
-                        commits_url = f"{self.base_url}/repos/{org}/{repo_name}/commits?author={username}&per_page=100"
-                        repo_commits = self._paginated_request(commits_url)
-                        if isinstance(repo_commits, list):
-                            org_stats['commits'] += len(repo_commits)
-                            stats['commits'] += len(repo_commits)
-                    
-                    # Check rate limit after each batch
-                    self.update_rate_limit_info()
-                    self.wait_for_rate_limit()
-                
-                # Get review activity
-                reviews_url = f"{self.base_url}/search/issues?q=reviewed-by:{username}+org:{org}+is:pr{self.time_filter}&per_page=100"
-                review_data = self._paginated_request(reviews_url)
-                if review_data and 'items' in review_data:
-                    org_stats['reviews_submitted'] = len(review_data['items'])
-                    stats['reviews_submitted'] += org_stats['reviews_submitted']
-                
-                # Get issue comments (participation)
-                # Split into two queries to avoid API limitations
-                comments_url_issues = f"{self.base_url}/search/issues?q=commenter:{username}+org:{org}+is:issue{self.time_filter}&per_page=100"
-                comments_data_issues = self._paginated_request(comments_url_issues)
-                
-                self.wait_for_rate_limit()  # Check rate limit between queries
-                
-                comments_url_prs = f"{self.base_url}/search/issues?q=commenter:{username}+org:{org}+is:pr{self.time_filter}&per_page=100"
-                comments_data_prs = self._paginated_request(comments_url_prs)
-                
-                comment_count = 0
-                if comments_data_issues and 'items' in comments_data_issues:
-                    comment_count += len(comments_data_issues['items'])
-                if comments_data_prs and 'items' in comments_data_prs:
-                    comment_count += len(comments_data_prs['items'])
-                    
-                org_stats['issues_commented'] = comment_count
-                stats['issues_commented'] += comment_count
-                
-                # Convert org's repo set to count for Excel output
+            if contributions is None:
+                logger.info(f"Analyzing {username}'s contributions to {', '.join(self.organizations)}...")
+                contributions = (await self._get_users_contributions([username]))[username]
+            user_id, org_contributions_list = contributions
+            for org_stats, org_contributions in zip(org_stats_list, org_contributions_list):
+                self._tally_org_stats(org_stats, *org_contributions)
+            
+            # Get commit count for every organization in one go
+            # Note: This is approximate as GitHub API doesn't provide a direct way to count all commits across an org
+            repos_by_org = [(org, sorted(org_stats['repos_contributed']))
+                            for org, org_stats in zip(self.organizations, org_stats_list)]
+            if user_id and any(repo_list for _, repo_list in repos_by_org):
+                commit_counts = await self._count_commits(user_id, repos_by_org)
+                for org_stats, commits in zip(org_stats_list, commit_counts):
+                    org_stats['commits'] = commits
+            
+            # Roll the per-organization metrics up into the overall totals
+            for org_stats in org_stats_list:
+                # Convert org's repo set to count for Excel output. Repositories of different
+                # organizations never coincide, so the overall count is just the sum
                 org_stats['repos_contributed'] = len(org_stats['repos_contributed'])
+                for key in self._metric_keys:
+                    stats[key] += org_stats[key]
         except Exception as e:
             logger.error(f"Error fetching stats for {username}: {str(e)}")
             raise
         
-        # Convert overall repo set to count for Excel output
-        stats['repos_contributed'] = len(stats['repos_contributed'])
-        
-        # Add organization breakdown to main stats
-        for org in self.organizations:
-            prefix = f"{org.replace('-', '_')}_"
-            for key, value in stats['organizations'][org].items():
-                stats[f"{prefix}{key}"] = value
-        
-        # Remove the organizations dict as we've flattened it
-        del stats['organizations']
+        # Add organization breakdown to main stats as flat, prefixed columns
+        for (org, prefix, flat_keys), org_stats in zip(self._org_columns, org_stats_list):
+            stats.update(zip(flat_keys, (org_stats[key] for key in self._metric_keys)))
         
         logger.info(f"Completed analysis for {username}: {stats['pr_merged']} merged PRs, {stats['commits']} commits across {stats['repos_contributed']} repositories")
         return stats
     
+    def _zero_stats(self, username):
+        """
+        Build the statistics of a user without any contributions.
+        
+        Args:
+            username (str): GitHub username
+            
+        Returns:
+            dict: Statistics with every overall and per-organization metric set to zero
+        """
+        stats = {'username': username, **dict.fromkeys(self._metric_keys, 0)}
+        for _, _, flat_keys in self._org_columns:
+            stats.update(dict.fromkeys(flat_keys, 0))
+        return stats
+    
+    async def _inactive_users(self, usernames):
+        """
+        Find users without any contributions on GitHub since the start of the time period.
+        
+        One aliased contributionsCollection probe covers the whole batch. The probe counts
+        commits, issues, PRs and reviews anywhere on GitHub, but not comments, so users
+        who only commented look inactive.
+        
+        Args:
+            usernames (list): GitHub usernames
+            
+        Returns:
+            set: Usernames that have no contributions in the time period
+        """
+        fields = "\n".join(
+            f"u{k}: user(login: {json_dumps(username).decode()}) {{ contributionsCollection(from: $since) {{ hasAnyContributions }} }}"
+            for k, username in enumerate(usernames)
+        )
+        data = await self._graphql(f"query($since: DateTime!) {{\n{fields}\n}}", {'since': self._since}, partial=True)
+        
+        # Users that failed or don't exist are left to the full analysis
+        inactive = set()
+        for k, username in enumerate(usernames):
+            collection = (data.get(f"u{k}") or {}).get('contributionsCollection') or {}
+            if collection.get('hasAnyContributions') is False:
+                inactive.add(username)
+        return inactive
+    
+    def _org_search_queries(self, username, org):
+        """
+        Build the search queries behind a user's metrics for a single organization.
+        
+        Args:
+            username (str): GitHub username
+            org (str): GitHub organization name
+            
+        Returns:
+            tuple: PR, issue, review and comment search queries
+        """
+        search_filter = self.time_filter.replace('+', ' ')
+        # Leaving out the is:issue/is:pr filter counts comments on issues and PRs in one query
+        return (
+            f"author:{username} org:{org} is:pr{search_filter}",
+            f"author:{username} org:{org} is:issue{search_filter}",
+            f"reviewed-by:{username} org:{org} is:pr{search_filter}",
+            f"commenter:{username} org:{org}{search_filter}",
+        )
+    
+    async def _get_users_contributions(self, usernames):
+        """
+        Fetch the node ID and search results of several users for every organization at once.
+        
+        Every user's searches for each organization are aliased into the same GraphQL
+        document, so a whole batch of users costs a single request. Searches that fail are
+        retried through the per-organization path, and result lists longer than a page are
+        completed from their end cursor.
+        
+        Args:
+            usernames (list): GitHub usernames
+            
+        Returns:
+            dict: Maps each username to its node ID and, per organization, the PR count,
+                PR nodes, issue count, issue nodes, review count and comment count
+        """
+        fields = []
+        for k, username in enumerate(usernames):
+            fields.append(f"u{k}: user(login: {json_dumps(username).decode()}) {{ id }}")
+            for i, org in enumerate(self.organizations):
+                prs_query, issues_query, reviews_query, comments_query = self._org_search_queries(username, org)
+                # PRs and issues are fetched with only the fields parsed later; reviews and
+                # comments are only counted, so their nodes aren't selected at all
+                for alias, search_query, fragment in ((f"u{k}_o{i}_prs", prs_query, PR_FRAGMENT),
+                                                      (f"u{k}_o{i}_issues", issues_query, ISSUE_FRAGMENT)):
+                    fields.append(
+                        f"{alias}: search(query: {json_dumps(search_query).decode()}, type: ISSUE, first: 100) "
+                        f"{{ issueCount pageInfo {{ hasNextPage endCursor }} nodes {{ {fragment} }} }}"
+                    )
+                for alias, search_query in ((f"u{k}_o{i}_reviews", reviews_query), (f"u{k}_o{i}_comments", comments_query)):
+                    fields.append(f"{alias}: search(query: {json_dumps(search_query).decode()}, type: ISSUE, first: 1) {{ issueCount }}")
+        
+        try:
+            # A gateway error on a multi-user query usually means it ran too long; splitting
+            # the batch beats replaying the same query, so only single users retry those
+            data = await self._graphql("query {\n" + "\n".join(fields) + "\n}", partial=True,
+                                       server_retries=5 if len(usernames) == 1 else 0)
+        except Exception as e:
+            message = str(e)
+            too_large = (isinstance(e, asyncio.TimeoutError) or 'MAX_NODE_LIMIT_EXCEEDED' in message
+                         or 'timeout' in message.lower()
+                         or message.startswith(('GraphQL request failed: 502', 'GraphQL request failed: 504')))
+            if not too_large or len(usernames) == 1:
+                raise
+            # Too many nodes or too slow for one query: split the batch and query both halves
+            half = len(usernames) // 2
+            logger.warning(f"GraphQL query too large for {len(usernames)} users ({message or type(e).__name__}), splitting the batch in two")
+            first, second = await asyncio.gather(
+                self._get_users_contributions(usernames[:half]),
+                self._get_users_contributions(usernames[half:]),
+            )
+            return {**first, **second}
+        
+        async def org_contributions(k, username, i, org):
+            aliases = [f"u{k}_o{i}_prs", f"u{k}_o{i}_issues", f"u{k}_o{i}_reviews", f"u{k}_o{i}_comments"]
+            if not all(data.get(alias) for alias in aliases):
+                logger.warning(f"Incomplete GraphQL data for {username} in {org}, falling back to per-query requests")
+                return await self._get_org_contributions(username, org)
+            
+            prs_query, issues_query, _, _ = self._org_search_queries(username, org)
+            prs, issues, reviews, comments = (data[alias] for alias in aliases)
+            pr_items, issue_items = await asyncio.gather(
+                self._remaining_nodes(prs, prs_query, PR_FRAGMENT),
+                self._remaining_nodes(issues, issues_query, ISSUE_FRAGMENT),
+            )
+            return (prs['issueCount'], pr_items, issues['issueCount'], issue_items,
+                    reviews['issueCount'], comments['issueCount'])
+        
+        async def user_contributions(k, username):
+            contributions = await asyncio.gather(*(
+                org_contributions(k, username, i, org) for i, org in enumerate(self.organizations)
+            ))
+            # A null user means the user doesn't exist; a missing one means the lookup failed
+            alias = f"u{k}"
+            user_id = (data[alias] or {}).get('id') if alias in data else await self._get_user_id(username)
+            return user_id, contributions
+        
+        results = await asyncio.gather(*(user_contributions(k, username) for k, username in enumerate(usernames)))
+        return dict(zip(usernames, results))
+    
+    async def _remaining_nodes(self, search, search_query, fragment):
+        """
+        Complete the nodes of a search result whose first page came from a batched query.
+        
+        Args:
+            search (dict): First page of the search, with issueCount, pageInfo and nodes
+            search_query (str): GitHub search query the page belongs to
+            fragment (str): Selection applied to each result node
+            
+        Returns:
+            list: Result nodes from every page
+        """
+        nodes = [node for node in search['nodes'] if node]
+        if search['pageInfo']['hasNextPage']:
+            _, more = await self._graphql_search(search_query, fragment, cursor=search['pageInfo']['endCursor'])
+            nodes.extend(more)
+        return nodes
+    
+    async def _get_org_contributions(self, username, org):
+        """
+        Fetch a user's search results for a single organization with one request per search.
+        
+        Args:
+            username (str): GitHub username
+            org (str): GitHub organization name
+            
+        Returns:
+            tuple: PR count, PR nodes, issue count, issue nodes, review count and comment count
+        """
+        prs_query, issues_query, reviews_query, comments_query = self._org_search_queries(username, org)
+        # Reviews and comments are only counted, so a single REST result page is enough for them
+        reviews_url = f"{self.base_url}/search/issues?q={reviews_query.replace(' ', '+')}"
+        comments_url = f"{self.base_url}/search/issues?q={comments_query.replace(' ', '+')}"
+        
+        # The search queries don't depend on each other, so issue them concurrently
+        (pr_count, pr_items), (issue_count, issue_items), review_count, comment_count = await asyncio.gather(
+            self._graphql_search(prs_query, PR_FRAGMENT),
+            self._graphql_search(issues_query, ISSUE_FRAGMENT),
+            self._search_count(reviews_url),
+            self._search_count(comments_url),
+        )
+        return pr_count, pr_items, issue_count, issue_items, review_count, comment_count
+    
+    def _tally_org_stats(self, org_stats, pr_count, pr_items, issue_count, issue_items, review_count, comment_count):
+        """
+        Fill in a user's per-organization metrics from their search results.
+        
+        Args:
+            org_stats (dict): Per-organization metrics dict to fill in
+            pr_count (int): Number of PRs created by the user
+            pr_items (list): PR nodes with state, merged and repository fields
+            issue_count (int): Number of issues opened by the user
+            issue_items (list): Issue nodes with state and repository fields
+            review_count (int): Number of PRs reviewed by the user
+            comment_count (int): Number of issues and PRs commented on by the user
+        """
+        # PRs created by user. The count comes from the search itself, so it stays exact
+        # even when the search caps the nodes it returns at 1000
+        org_stats['pr_total'] = pr_count
+        
+        # Process each PR to get more details, tallying into locals rather than the stats dict
+        repos = org_stats['repos_contributed']
+        pr_open = pr_merged = 0
+        for pr in pr_items:
+            state = pr.get('state')
+            if state == 'OPEN':
+                pr_open += 1
+            elif pr.get('merged'):
+                pr_merged += 1
+                
+            # Extract repository name
+            repository = pr.get('repository')
+            if repository:
+                repos.add(repository['name'])
+        org_stats['pr_open'] = pr_open
+        org_stats['pr_merged'] = pr_merged
+        
+        # Issues created by user
+        org_stats['issues_opened'] = issue_count
+        
+        # Count closed issues
+        issues_closed = 0
+        for issue in issue_items:
+            if issue.get('state') == 'CLOSED':
+                issues_closed += 1
+                
+            # Extract repository info
+            repository = issue.get('repository')
+            if repository:
+                repos.add(repository['name'])
+        org_stats['issues_closed'] = issues_closed
+        
+        # Review activity and issue/PR comments (participation)
+        org_stats['reviews_submitted'] = review_count
+        org_stats['issues_commented'] = comment_count
+    
+    async def _count_commits(self, user_id, repos_by_org):
+        """
+        Count a user's commits on the default branch of repositories across organizations.
+        
+        Repositories of every organization are aliased into batched GraphQL queries, so each
+        batch costs a single request instead of one paginated REST call per repository.
+        
+        Args:
+            user_id (str): GraphQL node ID of the user
+            repos_by_org (list): (organization, repository names) pairs
+            
+        Returns:
+            list: Total number of commits for each organization, in the given order
+        """
+        repos = [(i, f"o{i}_r{j}", org, repo_name)
+                 for i, (org, repo_names) in enumerate(repos_by_org)
+                 for j, repo_name in enumerate(repo_names)]
+        
+        repo_batch_size = 50  # Keep each query well within GraphQL node limits
+        queries = []
+        for start in range(0, len(repos), repo_batch_size):
+            fields = "\n".join(
+                f"{alias}: repository(owner: {json_dumps(org).decode()}, name: {json_dumps(repo_name).decode()}) "
+                "{ defaultBranchRef { target { ... on Commit { history(author: {id: $uid}) { totalCount } } } } }"
+                for _, alias, org, repo_name in repos[start:start+repo_batch_size]
+            )
+            queries.append(f"query($uid: ID!) {{\n{fields}\n}}")
+        
+        batches = await asyncio.gather(*(self._graphql(query, {'uid': user_id}) for query in queries))
+        
+        org_of = {alias: i for i, alias, _, _ in repos}
+        commits = [0] * len(repos_by_org)
+        for data in batches:
+            for alias, repo in data.items():
+                # Missing or empty repositories come back without a default branch
+                target = ((repo or {}).get('defaultBranchRef') or {}).get('target') or {}
+                commits[org_of[alias]] += target.get('history', {}).get('totalCount', 0)
+        return commits
+    
+    async def _get_user_id(self, username):
+        """
+        Resolve the GraphQL node ID of a user, caching it for later lookups.
+        
+        Args:
+            username (str): GitHub username
+            
+        Returns:
+            str: The user's node ID, or None if the user doesn't exist
+        """
+        # Cache the lookup task itself so concurrent organizations share a single request
+        if username not in self._user_ids:
+            self._user_ids[username] = asyncio.ensure_future(
+                self._graphql("query($login: String!) { user(login: $login) { id } }", {'login': username})
+            )
+        try:
+            data = await self._user_ids[username]
+        except BaseException:
+            self._user_ids.pop(username, None)
+            raise
+        return (data.get('user') or {}).get('id')
+    
     def analyze_users(self, usernames):
         """
         Analyze multiple users and return their statistics.
         
+        Synchronous wrapper around analyze_users_async that runs it on its own event loop.
+        
+        Args:
+            usernames (list): List of GitHub usernames
+            
+        Returns:
+            list: List of dictionaries with user statistics
+        """
+        async def run():
+            async with self:
+                return await self.analyze_users_async(usernames)
+        
+        return asyncio.run(run())
+    
+    async def analyze_users_async(self, usernames):
+        """
+        Analyze multiple users and return their statistics.
+        
+        Must be awaited while the analyzer's HTTP session is open (``async with analyzer``).
+        
         Args:
             usernames (list): List of GitHub usernames
             
         Returns:
             list: List of dictionaries with user statistics
         """
-        results = []
         # Filter out users that are already analyzed
-        pending_users = [u for u in usernames if u not in self.completed_users]
+        pending_users = [u for u in usernames if u.lower() not in self.completed_users]
         
         if len(pending_users) < len(usernames):
             logger.info(f"Skipping {len(usernames) - len(pending_users)} already analyzed users")
         
-        for i, username in enumerate(pending_users):
+        # Control how many batches run at once; the rate limiters stay the global bottleneck
+        sem = asyncio.Semaphore(self.concurrency)
+        
+        async def analyze_active(i, username, contributions):
             logger.info(f"[{i+1}/{len(pending_users)}] Analyzing contributions for {username}...")
             try:
-                # Check if we're nearing rate limit
-                self.update_rate_limit_info()
-                self.wait_for_rate_limit()
+                return await self.get_user_stats(username, contributions)
+            except Exception as e:
+                logger.error(f"Error analyzing {username}: {str(e)}")
                 
-                user_stats = self.get_user_stats(username)
-                results.append(user_stats)
+                # Only a rate limit error is worth retrying
+                if "API rate limit exceeded" not in str(e):
+                    return None
                 
-                # Mark user as completed and save progress
-                self.completed_users.add(username)
-                self.save_progress()
+                logger.warning("Rate limit exceeded. Waiting for reset...")
+                await self.update_rate_limit_info()
+                await self.wait_for_rate_limit('graphql')
                 
-                logger.info(f"Successfully analyzed {username}")
-            except Exception as e:
-                logger.error(f"Error analyzing {username}: {str(e)}")
+                # Try again
+                try:
+                    logger.info(f"Retrying analysis for {username}...")
+                    return await self.get_user_stats(username)
+                except Exception as retry_error:
+                    logger.error(f"Failed retry for {username}: {str(retry_error)}")
+                    return None
+        
+        async def analyze_one(i, username, contributions, inactive=False):
+            if inactive:
+                logger.info(f"[{i+1}/{len(pending_users)}] {username} has no contributions in the time period, skipping")
+                user_stats = self._zero_stats(username)
+            else:
+                user_stats = await analyze_active(i, username, contributions)
+                if user_stats is None:
+                    return None
+            
+            # Mark user as completed and save progress. The append is synchronous,
+            # so concurrent users can't interleave their lines
+            self.completed_users.add(username.lower())
+            self.save_progress(user_stats)
+            
+            logger.info(f"Successfully analyzed {username}")
+            return user_stats
+        
+        async def analyze_batch(start, batch):
+            async with sem:
+                # A cheap activity probe first, so users with nothing to count skip the full queries
+                inactive = set()
+                if self.skip_inactive:
+                    try:
+                        inactive = await self._inactive_users(batch)
+                    except Exception as e:
+                        logger.warning(f"Activity probe failed, analyzing the whole batch: {str(e)}")
+                active = [username for username in batch if username not in inactive]
                 
-                # If we hit rate limit
-                if "API rate limit exceeded" in str(e):
-                    logger.warning("Rate limit exceeded. Waiting for reset...")
-                    self.update_rate_limit_info()
-                    self.wait_for_rate_limit()
-                    
-                    # Try again
+                prefetched = {}
+                if active:
+                    logger.info(f"[{start+1}-{start+len(batch)}/{len(pending_users)}] Fetching contributions for {len(active)} users...")
                     try:
-                        logger.info(f"Retrying analysis for {username}...")
-                        user_stats = self.get_user_stats(username)
-                        results.append(user_stats)
-                        self.completed_users.add(username)
-                        self.save_progress()
-                        logger.info(f"Successfully analyzed {username} on retry")
-                    except Exception as retry_error:
-                        logger.error(f"Failed retry for {username}: {str(retry_error)}")
-                        # Save a partial progress marker that we attempted this user
-                        self.save_progress()
-        
-        # Also load results for already completed users if needed
-        if self.completed_users.difference(set(pending_users)):
-            logger.info("Loading cached results for previously analyzed users...")
-            try:
-                if os.path.exists('github_analysis_results.json'):
-                    with open('github_analysis_results.json', 'r') as f:
-                        cached_results = json.load(f)
-                        
-                    for cached_user in cached_results:
-                        if cached_user['username'] in self.completed_users and cached_user['username'] not in [u['username'] for u in results]:
-                            results.append(cached_user)
-                            logger.debug(f"Loaded cached result for {cached_user['username']}")
-            except Exception as e:
-                logger.error(f"Error loading cached results: {str(e)}")
+                        prefetched = await self._get_users_contributions(active)
+                    except Exception as e:
+                        # Every user of the batch falls back to a query of its own
+                        logger.error(f"Error fetching contributions for batch: {str(e)}")
+                return await asyncio.gather(*(
+                    analyze_one(start + j, username, prefetched.get(username), username in inactive)
+                    for j, username in enumerate(batch)
+                ))
         
-        # Save all results for future use
+        batch_size = self.user_batch_size
         try:
-            with open('github_analysis_results.json', 'w') as f:
-                json.dump(results, f)
-            logger.info(f"Saved analysis results for {len(results)} users to github_analysis_results.json")
-        except Exception as e:
-            logger.error(f"Warning: Couldn't save results to cache file: {str(e)}")
+            gathered = await asyncio.gather(*(
+                analyze_batch(start, pending_users[start:start+batch_size])
+                for start in range(0, len(pending_users), batch_size)
+            ))
+        except asyncio.CancelledError:
+            # Ctrl-C cancels every in-flight batch; finished users are already in the progress file
+            remaining = len([u for u in pending_users if u.lower() not in self.completed_users])
+            logger.warning(f"Analysis cancelled with {remaining} users left to analyze")
+            raise
+        results = [user_stats for batch in gathered for user_stats in batch if user_stats is not None]
+        
+        # Also include results for users completed in earlier runs
+        if self._cached_results:
+            logger.info("Loading cached results for previously analyzed users...")
+            seen = {u['username'].lower() for u in results}
+            for cached_user in self._cached_results:
+                if cached_user['username'].lower() not in seen:
+                    results.append(cached_user)
+                    seen.add(cached_user['username'].lower())
+                    logger.debug(f"Loaded cached result for {cached_user['username']}")
         
         return results
     
-    def export_to_excel(self, data, output_file="github_contributions.xlsx"):
+    def export_results(self, data, output_file="github_contributions.xlsx"):
         """
-        Export the contribution data to an Excel file.
+        Export the contribution data in the format picked by the output file's extension.
+        
+        .parquet files are written with pyarrow and .csv files as plain CSV;
+        any other file is exported as an Excel workbook.
         
         Args:
             data (list): List of dictionaries with user statistics
-            output_file (str): Path to the output Excel file
+            output_file (str): Path to the output file
         """
+        extension = os.path.splitext(output_file)[1].lower()
+        if extension not in ('.parquet', '.csv'):
+            self.export_to_excel(data, output_file)
+            return
+        
         if not data:
             logger.warning("No data to export. Please check if users exist and have contributions.")
             return
+        
+        df = self._build_report_frame(data)
+        logger.info(f"Exporting data for {len(df)} users to {output_file}")
+        if extension == '.csv':
+            self._export_csv(df, output_file)
+            logger.info(f"Data exported successfully to {output_file}")
+            return
+        
+        try:
+            # pyarrow is optional, only needed for Parquet output
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            csv_file = output_file[:-len(extension)] + '.csv'
+            logger.error("Parquet export requires pyarrow (pip install pyarrow)")
+            self._export_csv(df, csv_file)
+            logger.warning(f"Exported data to CSV instead: {csv_file}")
+            return
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), output_file)
+        logger.info(f"Data exported successfully to {output_file}")
+    
+    def _export_csv(self, df, csv_file):
+        """
+        Write the report frame to a CSV file row by row.
+        
+        Args:
+            df (pd.DataFrame): Report frame from _build_report_frame
+            csv_file (str): Path to the output CSV file
+        """
+        with open(csv_file, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(df.columns)
+            writer.writerows(df.itertuples(index=False, name=None))
+    
+    def _build_report_frame(self, data):
+        """
+        Build the report frame with contribution scores, sorted by overall score.
+        
+        Args:
+            data (list): List of dictionaries with user statistics
             
-        df = pd.DataFrame(data)
+        Returns:
+            pd.DataFrame: One row per user, with the overall and per-organization scores
+        """
+        # Build the frame with an explicit schema rather than per-column inference: counts fit in int32.
+        # Results cached before an organization was added lack its columns, so count those as zero
+        count_columns = list(self._metric_keys) + [key for _, _, flat_keys in self._org_columns for key in flat_keys]
+        schema = {'username': 'string', **dict.fromkeys(count_columns, 'int32')}
+        df = (pd.DataFrame.from_records(data, columns=list(schema))
+              .fillna(dict.fromkeys(count_columns, 0))
+              .astype(schema))
         
-        # Calculate composite score (example - customize as needed)
-        df['contribution_score'] = (
-            (df['pr_merged'] * 3) + 
-            (df['commits'] * 0.5) + 
-            (df['issues_opened'] * 1) + 
-            (df['issues_closed'] * 1.5) + 
-            (df['reviews_submitted'] * 2) +
-            (df['issues_commented'] * 0.5)
-        )
+        # Composite score weights (example - customize as needed)
+        score_columns = ['pr_merged', 'commits', 'issues_opened', 'issues_closed', 'reviews_submitted', 'issues_commented']
+        score_weights = np.array([3, 0.5, 1, 1.5, 2, 0.5], dtype=np.float32)
         
-        # Calculate org-specific scores
-        for org in self.organizations:
-            prefix = f"{org.replace('-', '_')}_"
-            df[f'{prefix}contribution_score'] = (
-                (df[f'{prefix}pr_merged'] * 3) + 
-                (df[f'{prefix}commits'] * 0.5) + 
-                (df[f'{prefix}issues_opened'] * 1) + 
-                (df[f'{prefix}issues_closed'] * 1.5) + 
-                (df[f'{prefix}reviews_submitted'] * 2) +
-                (df[f'{prefix}issues_commented'] * 0.5)
-            )
+        # Calculate the overall and org-specific scores together: stack every (prefix, metric)
+        # column into an (N, orgs + 1, 6) array and contract it with the weights in one product
+        score_prefixes = [''] + [prefix for _, prefix, _ in self._org_columns]
+        metrics = df[[f'{prefix}{col}' for prefix in score_prefixes for col in score_columns]].to_numpy(dtype=np.float32)
+        scores = metrics.reshape(len(df), len(score_prefixes), len(score_columns)) @ score_weights
+        df[[f'{prefix}contribution_score' for prefix in score_prefixes]] = scores
         
         # Sort by score
-        df = df.sort_values('contribution_score', ascending=False)
+        return df.sort_values('contribution_score', ascending=False)
+    
+    def export_to_excel(self, data, output_file="github_contributions.xlsx"):
+        """
+        Export the contribution data to an Excel file.
+        
+        Args:
+            data (list): List of dictionaries with user statistics
+            output_file (str): Path to the output Excel file
+        """
+        if not data:
+            logger.warning("No data to export. Please check if users exist and have contributions.")
+            return
+        
+        df = self._build_report_frame(data)
         
         # Metadata for the report
         metadata = {
@@ -397,20 +899,37 @@ class GitHubContributionAnalyzer:
         
         logger.info(f"Exporting data for {len(df)} users to Excel file: {output_file}")
         
-        # Create Excel writer
+        # Longest rendered value per column, sampled from the top rows and shared by every sheet
+        value_lengths = {col: df[col].head(500).astype(str).str.len().max() if len(df) > 0 else 0 for col in df.columns}
+        
+        # Create Excel writer. constant_memory flushes each row to disk once it is complete,
+        # so every sheet below is written strictly row by row with its widths set up front
         try:
-            with pd.ExcelWriter(output_file, engine='xlsxwriter') as writer:
+            with pd.ExcelWriter(output_file, engine='xlsxwriter', engine_kwargs={
+                'options': {'constant_memory': True, 'strings_to_urls': False}
+            }) as writer:
+                workbook = writer.book
+                
+                # Add formats
+                header_format = workbook.add_format({
+                    'bold': True,
+                    'text_wrap': True,
+                    'valign': 'top',
+                    'bg_color': '#D8E4BC',
+                    'border': 1
+                })
+                
                 # Metadata sheet
-                pd.DataFrame(list(metadata.items()), columns=['Metric', 'Value']).to_excel(
-                    writer, sheet_name='Report Info', index=False
-                )
+                self._write_sheet(workbook, 'Report Info', ['Metric', 'Value'], list(metadata.items()), [25, 50], header_format)
                 
                 # Convert to Excel - main summary
-                df.to_excel(writer, sheet_name='Overall Summary', index=False)
+                self._write_sheet(
+                    workbook, 'Overall Summary', list(df.columns), df.itertuples(index=False, name=None),
+                    [min(50, max(len(col), value_lengths[col])) * 1.2 for col in df.columns], header_format
+                )
                 
                 # Create sheets for each organization
-                for org in self.organizations:
-                    prefix = f"{org.replace('-', '_')}_"
+                for org, prefix, _ in self._org_columns:
                     org_columns = ['username'] + [col for col in df.columns if col.startswith(prefix)]
                     
                     # Rename columns to remove prefix
@@ -421,47 +940,12 @@ class GitHubContributionAnalyzer:
                     if 'contribution_score' in org_df.columns:
                         org_df = org_df.sort_values('contribution_score', ascending=False)
                     
-                    # Write to sheet
-                    org_df.to_excel(writer, sheet_name=f'{org} Summary', index=False)
-                
-                # Access the workbook and worksheets
-                workbook = writer.book
-                for sheet_name in writer.sheets:
-                    worksheet = writer.sheets[sheet_name]
-                    
-                    # Add formats
-                    header_format = workbook.add_format({
-                        'bold': True,
-                        'text_wrap': True,
-                        'valign': 'top',
-                        'bg_color': '#D8E4BC',
-                        'border': 1
-                    })
-                    
-                    # Get the dataframe for this sheet
-                    if sheet_name == 'Report Info':
-                        # Format the metadata sheet
-                        worksheet.set_column('A:A', 25)
-                        worksheet.set_column('B:B', 50)
-                        continue
-                    elif sheet_name == 'Overall Summary':
-                        sheet_df = df
-                    else:
-                        org = sheet_name.replace(' Summary', '')
-                        prefix = f"{org.replace('-', '_')}_"
-                        cols = ['username'] + [col for col in df.columns if col.startswith(prefix)]
-                        sheet_df = df[cols].copy()
-                        sheet_df.columns = [col.replace(prefix, '') if col.startswith(prefix) else col for col in sheet_df.columns]
-                    
-                    # Set column width and format headers
-                    for idx, col in enumerate(sheet_df.columns):
-                        col_values = sheet_df[col].astype(str)
-                        max_len = max(len(col) * 1.2, col_values.str.len().max() * 1.2) if len(col_values) > 0 else len(col) * 1.2
-                        worksheet.set_column(idx, idx, max_len)
-                    
-                    # Write header with format
-                    for col_num, value in enumerate(sheet_df.columns.values):
-                        worksheet.write(0, col_num, value, header_format)
+                    # Write to sheet, with capped widths from the shared value lengths
+                    self._write_sheet(
+                        workbook, f'{org} Summary', list(org_df.columns), org_df.itertuples(index=False, name=None),
+                        [min(50, max(len(header), value_lengths[col])) * 1.2 for header, col in zip(org_df.columns, org_columns)],
+                        header_format
+                    )
                 
                 # Add charts
                 chart_sheet = workbook.add_worksheet('Contribution Charts')
@@ -484,8 +968,7 @@ class GitHubContributionAnalyzer:
                     chart = workbook.add_chart({'type': 'column'})
                     
                     # Add a series for each organization
-                    for i, org in enumerate(self.organizations):
-                        prefix = f"{org.replace('-', '_')}_"
+                    for org, prefix, _ in self._org_columns:
                         if f'{prefix}{metric}' in df.columns:
                             chart.add_series({
                                 'name': f'{org}',
@@ -505,107 +988,343 @@ class GitHubContributionAnalyzer:
             try:
                 # Fallback to CSV export
                 csv_file = output_file.replace('.xlsx', '.csv')
-                df.to_csv(csv_file, index=False)
+                self._export_csv(df, csv_file)
                 logger.warning(f"Exported data to CSV instead: {csv_file}")
             except:
                 logger.error("Failed to export data in any format.")
     
-    def _paginated_request(self, url):
+    def _write_sheet(self, workbook, sheet_name, columns, rows, column_widths, header_format):
         """
-        Make paginated requests to GitHub API.
+        Write a worksheet row by row, as required by xlsxwriter's constant_memory mode.
         
         Args:
-            url (str): GitHub API URL
+            workbook (xlsxwriter.Workbook): Workbook to add the sheet to
+            sheet_name (str): Name of the new worksheet
+            columns (list): Header row
+            rows (iterable): Data rows, in the order they should appear
+            column_widths (list): Width of each column
+            header_format (xlsxwriter.format.Format): Format applied to the header row
+        """
+        worksheet = workbook.add_worksheet(sheet_name)
+        for idx, width in enumerate(column_widths):
+            worksheet.set_column(idx, idx, width)
+        
+        worksheet.write_row(0, 0, columns, header_format)
+        for row_num, row in enumerate(rows, start=1):
+            worksheet.write_row(row_num, 0, row)
+    
+    async def _graphql(self, query, variables=None, partial=False, server_retries=5):
+        """
+        Make a GraphQL request to GitHub API.
+        
+        Args:
+            query (str): GraphQL query document
+            variables (dict, optional): Variables referenced by the query
+            partial (bool): Return whatever data came back instead of raising on field errors.
+                Top-level fields that failed are left out of the result
+            server_retries (int): How often to retry gateway errors before giving up
             
         Returns:
-            dict/list: Combined results from all pages
+            dict: The 'data' member of the response
         """
-        # Check cache first
-        if url in self.cache:
-            logger.debug(f"Using cached response for {url}")
-            return self.cache[url]
+        logger.debug(f"Making GraphQL request with variables: {variables}")
+        # Ask for the query's point cost in-band, so the budget is tracked from what GitHub charged
+        query = f"{query.rstrip()[:-1]}rateLimit {{ cost remaining resetAt }}\n}}"
+        status, _, body = await self._request('POST', f"{self.base_url}/graphql", json={'query': query, 'variables': variables or {}},
+                                              server_retries=server_retries)
+        
+        if status != 200:
+            raise Exception(f"GraphQL request failed: {status} - {body.decode(errors='replace')}")
+        
+        payload = json_loads(body)
+        data = payload.get('data') or {}
+        rate_limit = data.pop('rateLimit', None)
+        if rate_limit:
+            self._graphql_cost = rate_limit['cost']
+            logger.debug(f"GraphQL query cost {rate_limit['cost']} points, {rate_limit['remaining']} remaining until {rate_limit['resetAt']}")
+        # NOT_FOUND errors just mean a user or repository doesn't exist; their fields come back as null
+        errors = [e for e in payload.get('errors') or [] if e.get('type') != 'NOT_FOUND']
+        if errors:
+            if not partial or not data or not all(e.get('path') for e in errors):
+                raise Exception(f"GraphQL errors: {errors}")
+            logger.warning(f"GraphQL returned partial data: {errors}")
+            for e in errors:
+                data.pop(e['path'][0], None)
+        return data
+    
+    async def _graphql_search(self, search_query, fragment, cursor=None):
+        """
+        Run a GraphQL issue/PR search and collect the result nodes from every page.
+        
+        Args:
+            search_query (str): GitHub search query, e.g. "author:octocat org:github is:pr"
+            fragment (str): Selection applied to each result node
+            cursor (str, optional): Start after this cursor instead of at the first page
             
-        # Check rate limit before making request
-        self.wait_for_rate_limit()
+        Returns:
+            tuple: Total number of matches and the list of result nodes
+        """
+        cache_key = f"graphql:{search_query}:{fragment}:{cursor}"
+        if cache_key in self.cache:
+            logger.debug(f"Using cached response for {search_query}")
+            return self.cache[cache_key]
+        
+        query = f"""
+        query($searchQuery: String!, $cursor: String) {{
+            search(query: $searchQuery, type: ISSUE, first: 100, after: $cursor) {{
+                issueCount
+                pageInfo {{ hasNextPage endCursor }}
+                nodes {{ {fragment} }}
+            }}
+        }}
+        """
+        
+        nodes = []
+        while True:
+            data = await self._graphql(query, {'searchQuery': search_query, 'cursor': cursor})
+            search = data['search']
+            nodes.extend(node for node in search['nodes'] if node)
+            if not search['pageInfo']['hasNextPage']:
+                break
+            cursor = search['pageInfo']['endCursor']
+        
+        result = (search['issueCount'], nodes)
+        self.cache[cache_key] = result
+        return result
+    
+    async def _request(self, method, url, server_retries=5, **kwargs):
+        """
+        Make a throttled request to GitHub API, waiting and retrying on rate limits
+        and transient server errors.
         
-        results = None
-        next_url = url
-        page_count = 0
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            server_retries (int): How often to retry 502, 503 and 504 responses
+            **kwargs: Extra arguments for the aiohttp request
+            
+        Returns:
+            tuple: Status code, response headers and raw response body
+        """
+        limiters = [self._primary_limiter, self._secondary_limiter]
+        if url.endswith('/graphql'):
+            resource = 'graphql'
+        elif '/search/' in url:
+            resource = 'search'
+            limiters.append(self._search_limiter)
+        else:
+            resource = 'core'
+        headers = kwargs.pop('headers', None) or {}
+        
+        attempt = 0
+        max_rate_limit_retries = 5
+        server_errors = 0
+        max_server_retries = server_retries
+        while True:
+            token = await self.wait_for_rate_limit(resource)
+            for limiter in limiters:
+                await limiter.acquire()
+            
+            request_headers = {**headers, 'Authorization': f'token {token}'}
+            async with self.session.request(method, url, headers=request_headers, **kwargs) as response:
+                status = response.status
+                response_headers = response.headers
+                body = await response.read()
+            
+            # Update the token's rate limit info from response headers
+            token_limit = self._token_limits[token].setdefault(
+                response_headers.get('X-RateLimit-Resource', resource), [5000, 0])
+            if 'X-RateLimit-Remaining' in response_headers:
+                token_limit[0] = int(response_headers['X-RateLimit-Remaining'])
+            if 'X-RateLimit-Reset' in response_headers:
+                token_limit[1] = int(response_headers['X-RateLimit-Reset'])
+            
+            if status in (502, 503, 504) and server_errors < max_server_retries:
+                # Transient gateway errors: back off 1, 2, 4, ... seconds unless told how long to wait
+                wait_time = int(response_headers.get('Retry-After', 2 ** server_errors))
+                server_errors += 1
+                logger.warning(f"Server error ({status}). Retrying in {wait_time} seconds... (Attempt {server_errors}/{max_server_retries})")
+                await asyncio.sleep(wait_time)
+                continue
+            
+            rate_limited = status == 429 or (status == 403 and b'rate limit' in body.lower())
+            if resource == 'graphql' and status == 200 and b'"RATE_LIMITED"' in body:
+                # GraphQL reports an exhausted primary limit as a 200 response with a RATE_LIMITED
+                # error; check the errors themselves, since the data may contain the same string
+                try:
+                    errors = json_loads(body).get('errors') or []
+                except ValueError:
+                    errors = []
+                rate_limited = any(error.get('type') == 'RATE_LIMITED' for error in errors)
+            if not rate_limited:
+                return status, response_headers, body
+            
+            attempt += 1
+            if attempt > max_rate_limit_retries:
+                # Give up on this request; callers wait for the reset or fall back from here
+                raise Exception(f"API rate limit exceeded after {max_rate_limit_retries} retries: {status} - {body.decode(errors='replace')}")
+            if 'Retry-After' in response_headers:
+                # Secondary rate limits tell us exactly how long to back off; add a second of margin
+                wait_time = int(response_headers['Retry-After']) + 1
+            elif token_limit[0] == 0:
+                # Primary rate limit of this token exhausted: retry right away, so the next
+                # request goes out with another token or waits for the window to reset
+                logger.warning(f"Rate limit hit ({status}). Switching tokens or waiting for the reset...")
+                continue
+            elif status == 403:
+                # Secondary rate limit without a Retry-After: GitHub asks for at least a minute
+                wait_time = 60 + random.uniform(0, 2 ** min(attempt, 6))
+            else:
+                # Exponential backoff with jitter
+                wait_time = random.uniform(0, 2 ** min(attempt, 6))
+            logger.warning(f"Rate limit hit ({status}). Waiting for {wait_time:.1f} seconds before retrying...")
+            await asyncio.sleep(wait_time)
+    
+    async def _get_page(self, url):
+        """
+        Fetch a single page from GitHub API, revalidating it against the ETag cache.
+        
+        Args:
+            url (str): GitHub API URL
+            
+        Returns:
+            tuple: Parsed JSON body and the page's Link header
+        """
         max_retries = 3
         retry_count = 0
         
-        while next_url:
+        while True:
             try:
-                logger.debug(f"Making API request to: {next_url}")
-                response = requests.get(next_url, headers=self.headers)
-                
-                # Update rate limit info from response headers
-                if 'X-RateLimit-Remaining' in response.headers:
-                    self.rate_limit_remaining = int(response.headers['X-RateLimit-Remaining'])
-                if 'X-RateLimit-Reset' in response.headers:
-                    self.rate_limit_reset = int(response.headers['X-RateLimit-Reset'])
-                
-                if response.status_code == 403 and 'rate limit exceeded' in response.text.lower():
-                    wait_time = self.rate_limit_reset - time.time() + 5
-                    if wait_time > 0:
-                        logger.warning(f"Rate limit exceeded. Waiting for {wait_time:.1f} seconds...")
-                        time.sleep(wait_time)
-                        # Try the request again after waiting
-                        return self._paginated_request(url)
-                    else:
-                        self.update_rate_limit_info()
-                    
-                if response.status_code != 200:
-                    raise Exception(f"API request failed: {response.status_code} - {response.text}")
-                
-                retry_count = 0  # Reset retry count on successful response
-                data = response.json()
-                page_count += 1
-                
-                # Initialize results based on data type
-                if results is None:
-                    if isinstance(data, list):
-                        results = []
-                    elif isinstance(data, dict) and 'items' in data:
-                        results = {'items': []}
-                    else:
-                        results = data
-                        break  # If it's not a list or doesn't have items, we don't paginate
-                
-                # Combine results
-                if isinstance(results, list) and isinstance(data, list):
-                    results.extend(data)
-                elif 'items' in results and 'items' in data:
-                    results['items'].extend(data['items'])
-                
-                # Check for pagination links
-                link_header = response.headers.get('Link', '')
-                next_url = None
-                
-                for link in link_header.split(','):
-                    if 'rel="next"' in link:
-                        next_url = link[link.index('<') + 1:link.index('>')]
-                        break
-                
-                # If we're continuing to next page, check rate limit
-                if next_url:
-                    logger.debug(f"Fetching page {page_count+1} for {url.split('?')[0]}...")
-                    self.wait_for_rate_limit()
-            except requests.exceptions.RequestException as e:
+                logger.debug(f"Making API request to: {url}")
+                # Revalidate pages fetched in earlier runs instead of downloading them again
+                cached_page = self.etag_cache.get(url)
+                request_headers = {'If-None-Match': cached_page[0]} if cached_page else None
+                status, response_headers, body = await self._request('GET', url, headers=request_headers)
+                break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logger.error(f"Network error: {str(e)}")
                 if retry_count < max_retries:
                     retry_count += 1
                     wait_time = 2 ** retry_count  # Exponential backoff
                     logger.warning(f"Retrying in {wait_time} seconds... (Attempt {retry_count}/{max_retries})")
-                    time.sleep(wait_time)
-                    continue
+                    await asyncio.sleep(wait_time)
                 else:
                     logger.error(f"Max retries exceeded for {url}")
                     raise
         
-        # Cache the result to avoid duplicating requests
-        self.cache[url] = results
-        return results
+        if status == 304 and cached_page:
+            # Not modified: reuse the stored page (doesn't count against the rate limit)
+            _, body, link_header = cached_page
+            return json_loads(body), link_header
+        if status != 200:
+            raise Exception(f"API request failed: {status} - {body.decode(errors='replace')}")
+        
+        link_header = response_headers.get('Link', '')
+        if 'ETag' in response_headers:
+            self.etag_cache.set(url, response_headers['ETag'], body, link_header)
+        return json_loads(body), link_header
+    
+    async def _search_count(self, url):
+        """
+        Get the number of search results from a single one-item page.
+        
+        Args:
+            url (str): GitHub search API URL, without a per_page parameter
+            
+        Returns:
+            int: Total number of matching results
+        """
+        url = f"{url}&per_page=1"
+        if url in self.cache:
+            logger.debug(f"Using cached response for {url}")
+            return self.cache[url]
+        
+        data, _ = await self._get_page(url)
+        count = data.get('total_count', 0)
+        self.cache[url] = count
+        return count
+
+def _ask(prompt, default=None, env=None):
+    """
+    Read a setting from the environment, prompting for it only in interactive runs.
+    
+    Args:
+        prompt (str): Prompt shown when stdin is a terminal
+        default (str, optional): Value used when stdin isn't a terminal, e.g. under cron or CI
+        env (str, optional): Environment variable checked before prompting
+        
+    Returns:
+        str: The setting's value
+    """
+    value = os.getenv(env) if env else None
+    if value is not None:
+        return value
+    return input(prompt) if sys.stdin.isatty() else default
+
+
+@dataclass
+class Config:
+    """Settings of a run, read from the environment once and validated up front"""
+    github_tokens: List[str]
+    organizations: List[str]
+    usernames: List[str] = field(default_factory=list)
+    time_period_months: Optional[int] = None
+    output_file: str = "github_contributions.xlsx"
+    concurrency: int = 5
+    assume_yes: bool = False
+    skip_inactive: bool = False
+    
+    @classmethod
+    def from_env(cls, argv=()):
+        """
+        Build the configuration from environment variables, prompting for missing ones in interactive runs.
+        
+        Args:
+            argv (list): Command line arguments, checked for --assume-yes
+            
+        Returns:
+            Config: The parsed configuration
+            
+        Raises:
+            ValueError: If a required setting is missing or a number is malformed
+        """
+        # Several comma-separated tokens in GITHUB_TOKENS are rotated between to multiply the rate limit
+        github_tokens = cls._split(os.getenv("GITHUB_TOKENS") or _ask("Enter your GitHub Personal Access Token: ", env="GITHUB_TOKEN"))
+        if not github_tokens:
+            raise ValueError("GitHub token is required")
+        
+        # Time period in months (default: all time - None)
+        time_period = _ask("Enter time period to analyze (in months, press Enter for all time): ", env="TIME_PERIOD")
+        
+        concurrency = cls._parse_count("CONCURRENCY", os.getenv("CONCURRENCY"))
+        if concurrency == 0:
+            raise ValueError("CONCURRENCY must be at least 1")
+        
+        return cls(
+            github_tokens=github_tokens,
+            organizations=cls._split(os.getenv("GITHUB_ORGS", "AOSSIE-Org,StabilityNexus")),
+            usernames=cls._split(os.getenv("GITHUB_USERS")),
+            time_period_months=cls._parse_count("TIME_PERIOD", time_period),
+            output_file=os.getenv("OUTPUT_FILE", "github_contributions.xlsx"),
+            concurrency=concurrency if concurrency is not None else 5,
+            # Unattended runs answer yes to confirmations instead of stopping
+            assume_yes='--assume-yes' in argv or os.getenv("GITHUB_ASSUME_YES") == "1",
+            skip_inactive=os.getenv("SKIP_INACTIVE") == "1",
+        )
+    
+    @staticmethod
+    def _split(value):
+        """Split a comma-separated setting into its non-empty items"""
+        return [item.strip() for item in (value or "").split(",") if item.strip()]
+    
+    @staticmethod
+    def _parse_count(name, value):
+        """Parse a non-negative whole number setting, returning None when it is blank"""
+        if value is None or not value.strip():
+            return None
+        if not value.strip().isdigit():
+            raise ValueError(f"{name} must be a whole number, got {value!r}")
+        return int(value)
 
 
 def main():
@@ -616,81 +1335,83 @@ def main():
     print("Current Date and Time (UTC):", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     
     # Get config from .env file or prompt user
-    github_token = os.getenv("GITHUB_TOKEN")
-    if not github_token:
-        github_token = input("Enter your GitHub Personal Access Token: ")
-        if not github_token:
-            logger.error("Error: GitHub token is required")
-            sys.exit(1)
-    
-    # Get organizations from .env
-    org_str = os.getenv("GITHUB_ORGS", "AOSSIE-Org,StabilityNexus")
-    organizations = [org.strip() for org in org_str.split(",")]
+    try:
+        config = Config.from_env(sys.argv[1:])
+    except ValueError as e:
+        logger.error(f"Error: {e}")
+        sys.exit(1)
+    
+    organizations = config.organizations
     print(f"Analyzing contributions across the following organizations: {', '.join(organizations)}")
     
     # Get usernames from .env or file
-    usernames = []
-    env_usernames = os.getenv("GITHUB_USERS")
+    usernames = config.usernames
     username_file = 'github_usernames.txt'
     
-    if env_usernames:
-        usernames = [name.strip() for name in env_usernames.split(",") if name.strip()]
+    if usernames:
         logger.info(f"Loaded {len(usernames)} usernames from environment variables")
     elif os.path.exists(username_file):
-        with open(username_file, 'r') as f:
-            usernames = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        # Read the file in one call and split it as bytes in one pass
+        with open(username_file, 'rb') as f:
+            usernames = [line.strip().decode() for line in f.read().splitlines()
+                         if line.strip() and not line.startswith(b'#')]
         logger.info(f"Loaded {len(usernames)} usernames from {username_file}")
     else:
-        # Prompt for usernames
-        print("Enter GitHub usernames to analyze (one per line). Enter a blank line when done:")
-        while True:
-            username = input()
-            if not username:
-                break
-            usernames.append(username)
+        if sys.stdin.isatty():
+            # Prompt for usernames; a pasted list is read in one go until end of input
+            eof_key = "Ctrl-Z then Enter" if os.name == 'nt' else "Ctrl-D"
+            print(f"Enter GitHub usernames to analyze (one per line). Press {eof_key} when done:")
+        # Interactive or piped, take all of stdin at once, one username per line
+        usernames = [line.strip() for line in sys.stdin.read().splitlines() if line.strip()]
 
     if not usernames:
         logger.error("No usernames provided. Exiting.")
         sys.exit(1)
 
-    # Save usernames to file for future use
-    with open(username_file, 'w') as f:
-        f.write("# GitHub usernames for contribution analysis\n")
-        for username in usernames:
-            f.write(f"{username}\n")
+    # GitHub logins are case-insensitive, so drop repeated names regardless of case
+    unique_usernames = list(dict.fromkeys(username.lower() for username in usernames))
+    if len(unique_usernames) != len(usernames):
+        logger.info(f"Deduplicated to {len(unique_usernames)} unique usernames")
+    usernames = unique_usernames
+
+    # Save usernames to file for future use, in a single write
+    with open(username_file, 'wb') as f:
+        f.write(b"# GitHub usernames for contribution analysis\n" + "".join(f"{username}\n" for username in usernames).encode())
 
-    # Time period in months (default: all time - None)
-    time_period = os.getenv("TIME_PERIOD")
-    if not time_period:
-        time_period = input("Enter time period to analyze (in months, press Enter for all time): ")
-    
-    time_period = int(time_period) if time_period and time_period.isdigit() else None
-    
-    # Output file
-    output_file = os.getenv("OUTPUT_FILE", "github_contributions.xlsx")
-    
     # Create analyzer and process data
     logger.info(f"Analyzing contributions for {len(usernames)} users across {len(organizations)} organizations...")
-    analyzer = GitHubContributionAnalyzer(github_token, organizations, time_period)
+    analyzer = GitHubContributionAnalyzer(config.github_tokens, organizations, config.time_period_months,
+                                          config.concurrency, config.skip_inactive)
+    
+    async def run():
+        # The rate limit check and the analysis share one session, so the whole run
+        # goes over the same keep-alive connections
+        async with analyzer:
+            # First check rate limit to ensure we have enough requests available. Each batch of
+            # users costs a GraphQL query, and the analyzer waits for the reset whenever a query
+            # wouldn't fit in the remaining points, so only a nearly exhausted budget is worth a prompt
+            await analyzer.update_rate_limit_info()
+            
+            if analyzer.rate_limit_remaining < 100:
+                logger.warning(f"Warning: Only {analyzer.rate_limit_remaining} GraphQL points remaining!")
+                proceed = config.assume_yes or (_ask("Continue anyway? (y/n): ", default="n") or "").lower() == 'y'
+                if not proceed:
+                    if not sys.stdin.isatty():
+                        # Distinct exit status, so a scheduler can retry once the budget has reset
+                        reset_time = datetime.fromtimestamp(analyzer.rate_limit_reset).strftime('%Y-%m-%d %H:%M:%S')
+                        logger.error(f"Rate limit too low for an unattended run. Retry after {reset_time} or pass --assume-yes")
+                        sys.exit(2)
+                    logger.info("Exiting.")
+                    sys.exit(0)
+            
+            return await analyzer.analyze_users_async(usernames)
     
     try:
-        # First check rate limit to ensure we have enough requests available
-        analyzer.update_rate_limit_info()
-        estimated_requests = len(usernames) * len(organizations) * 5  # Rough estimate
-        
-        if analyzer.rate_limit_remaining < 100 or analyzer.rate_limit_remaining < estimated_requests * 0.1:
-            logger.warning(f"Warning: Only {analyzer.rate_limit_remaining} API requests remaining!")
-            logger.warning(f"Estimated requests needed: ~{estimated_requests}")
-            proceed = input("Continue anyway? (y/n): ").lower() == 'y'
-            if not proceed:
-                logger.info("Exiting.")
-                sys.exit(0)
-                
-        results = analyzer.analyze_users(usernames)
+        results = asyncio.run(run())
         
-        # Export to Excel
+        # Export in the format given by the output file's extension
         if results:
-            analyzer.export_to_excel(results, output_file)
+            analyzer.export_results(results, config.output_file)
         else:
             logger.warning("No results to export. Please check GitHub API access and user contributions.")
     except KeyboardInterrupt: